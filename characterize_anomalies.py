@@ -1,24 +1,27 @@
 """Characterize MiniMax and grok anomalies quantitatively."""
-import json
 from pathlib import Path
 
+import numpy as np
+
+from results_io import iter_all, write_json
+
 RESULTS_DIR = Path("results_jury")
 ABLATION_DIR = Path("results_jury_ablation")
 
-def load_all(directory):
-    results = []
-    for f in sorted(directory.glob("*.json")):
-        with open(f) as fh:
-            results.append(json.load(fh))
-    return results
+def _column(rows, field, dtype=np.float64):
+    """One field of the extracted rows as a NumPy array."""
+    return np.fromiter((x[field] for x in rows), dtype=dtype, count=len(rows))
 
-def main():
-    baseline = load_all(RESULTS_DIR)
-    ablation = load_all(ABLATION_DIR)
 
+def _mean_or_zero(values):
+    return values.mean() if values.size else 0
+
+
+def main():
     report = {"minimax": {"baseline_cl05": [], "ablation_cl05": []}, "grok": {"cl00_responses": []}}
 
-    for r in baseline:
+    # Files are streamed one at a time; only the extracted fields below are kept
+    for r in iter_all(RESULTS_DIR):
         model = r["subject_model"]
         concept = r["concept"]
         
@@ -51,7 +54,7 @@ def main():
                 })
 
     # MiniMax ablation
-    for r in ablation:
+    for r in iter_all(ABLATION_DIR):
         if "MiniMax" not in r["subject_model"]:
             continue
         for p in r["performance"]:
@@ -71,16 +74,23 @@ def main():
     mm_abl = report["minimax"]["ablation_cl05"]
     grok_cl0 = report["grok"]["cl00_responses"]
 
+    # Each summary field is read once into an array and reduced vectorized
+    base_json = _column(mm_base, "is_json_dump", bool)
+    base_len = _column(mm_base, "response_length")
+    abl_json = _column(mm_abl, "is_json_dump", bool)
+    abl_len = _column(mm_abl, "response_length")
     report["minimax"]["summary"] = {
-        "domains_with_json_dump": sum(1 for x in mm_base if x["is_json_dump"]),
+        "domains_with_json_dump": int(base_json.sum()),
         "total_domains": len(mm_base),
-        "mean_response_length": sum(x["response_length"] for x in mm_base) / len(mm_base) if mm_base else 0,
-        "mean_cc_baseline": sum(x["cc"] for x in mm_base) / len(mm_base) if mm_base else 0,
-        "ablation_json_dumps": sum(1 for x in mm_abl if x["is_json_dump"]),
-        "mean_cc_ablation": sum(x["cc"] for x in mm_abl) / len(mm_abl) if mm_abl else 0,
-        "mean_response_length_ablation": sum(x["response_length"] for x in mm_abl) / len(mm_abl) if mm_abl else 0,
+        "mean_response_length": _mean_or_zero(base_len),
+        "mean_cc_baseline": _mean_or_zero(_column(mm_base, "cc")),
+        "ablation_json_dumps": int(abl_json.sum()),
+        "mean_cc_ablation": _mean_or_zero(_column(mm_abl, "cc")),
+        "mean_response_length_ablation": _mean_or_zero(abl_len),
     }
 
+    grok_meta = _column(grok_cl0, "has_meta_commentary", bool)
+    grok_cc = _column(grok_cl0, "cc")
     meta_domains = [x["concept"] for x in grok_cl0 if x["has_meta_commentary"]]
     clean_domains = [x["concept"] for x in grok_cl0 if not x["has_meta_commentary"]]
     report["grok"]["summary"] = {
@@ -88,30 +98,33 @@ def main():
         "domains_clean": len(clean_domains),
         "meta_domains": meta_domains,
         "clean_domains": clean_domains,
-        "mean_cc_with_meta": sum(x["cc"] for x in grok_cl0 if x["has_meta_commentary"]) / max(len(meta_domains), 1),
-        "mean_cc_clean": sum(x["cc"] for x in grok_cl0 if not x["has_meta_commentary"]) / max(len(clean_domains), 1),
+        "mean_cc_with_meta": grok_cc[grok_meta].sum() / max(len(meta_domains), 1),
+        "mean_cc_clean": grok_cc[~grok_meta].sum() / max(len(clean_domains), 1),
     }
 
-    with open("anomaly_report.json", "w") as f:
-        json.dump(report, f, indent=2)
-
-    # Print
-    print("=== ANOMALY REPORT ===")
-    print(f"\n--- MiniMax (Reasoning Trace Leakage) ---")
-    print(f"JSON dumps at CL=0.5 (baseline): {report['minimax']['summary']['domains_with_json_dump']}/{report['minimax']['summary']['total_domains']}")
-    print(f"Mean response length (baseline): {report['minimax']['summary']['mean_response_length']:.0f} words")
-    print(f"Mean CC (baseline): {report['minimax']['summary']['mean_cc_baseline']:.3f}")
-    print(f"JSON dumps at CL=0.5 (ablation): {report['minimax']['summary']['ablation_json_dumps']}/{len(mm_abl)}")
-    print(f"Mean CC (ablation): {report['minimax']['summary']['mean_cc_ablation']:.3f}")
-    print(f"Mean response length (ablation): {report['minimax']['summary']['mean_response_length_ablation']:.0f} words")
-
-    print(f"\n--- grok-4-20-reasoning (Meta-Commentary) ---")
-    print(f"Domains with meta-commentary at CL=0.0: {report['grok']['summary']['domains_with_meta']}/8")
-    print(f"  Meta domains: {meta_domains}")
-    print(f"  Clean domains: {clean_domains}")
-    print(f"Mean CC (with meta): {report['grok']['summary']['mean_cc_with_meta']:.3f}")
-    print(f"Mean CC (clean): {report['grok']['summary']['mean_cc_clean']:.3f}")
-    print(f"\n✓ Saved to anomaly_report.json")
+    write_json(report, "anomaly_report.json")
+
+    # Build the report text once and emit it in a single write
+    mm_summary = report["minimax"]["summary"]
+    grok_summary = report["grok"]["summary"]
+    lines = [
+        "=== ANOMALY REPORT ===",
+        f"\n--- MiniMax (Reasoning Trace Leakage) ---",
+        f"JSON dumps at CL=0.5 (baseline): {mm_summary['domains_with_json_dump']}/{mm_summary['total_domains']}",
+        f"Mean response length (baseline): {mm_summary['mean_response_length']:.0f} words",
+        f"Mean CC (baseline): {mm_summary['mean_cc_baseline']:.3f}",
+        f"JSON dumps at CL=0.5 (ablation): {mm_summary['ablation_json_dumps']}/{len(mm_abl)}",
+        f"Mean CC (ablation): {mm_summary['mean_cc_ablation']:.3f}",
+        f"Mean response length (ablation): {mm_summary['mean_response_length_ablation']:.0f} words",
+        f"\n--- grok-4-20-reasoning (Meta-Commentary) ---",
+        f"Domains with meta-commentary at CL=0.0: {grok_summary['domains_with_meta']}/8",
+        f"  Meta domains: {meta_domains}",
+        f"  Clean domains: {clean_domains}",
+        f"Mean CC (with meta): {grok_summary['mean_cc_with_meta']:.3f}",
+        f"Mean CC (clean): {grok_summary['mean_cc_clean']:.3f}",
+        f"\n✓ Saved to anomaly_report.json",
+    ]
+    print("\n".join(lines))
 
 if __name__ == "__main__":
     main()
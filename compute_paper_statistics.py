@@ -1,123 +1,123 @@
 """Compute all aggregate statistics needed for the TMLR paper."""
-import json
 import numpy as np
+import pandas as pd
 from pathlib import Path
 from scipy import stats
 
+from results_io import load_all_scores, write_json
+
 RESULTS_DIR = Path("results_jury")
 ABLATION_DIR = Path("results_jury_ablation")
 
-def load_all(directory):
-    results = []
-    for f in sorted(directory.glob("*.json")):
-        with open(f) as fh:
-            results.append(json.load(fh))
-    return results
-
-def get_scores_at_cl(result, cl, dim):
-    """Extract consensus score for dimension at compression level."""
+def index_by_cl(result):
+    """Map compression level (rounded to 2 dp) -> consensus dict, built once per result."""
+    index = {}
     for p in result["performance"]:
-        if abs(p["compression_level"] - cl) < 0.01:
-            return p["jury_evaluation"]["consensus"].get(dim)
-    return None
+        index.setdefault(round(p["compression_level"], 2), p["jury_evaluation"]["consensus"])
+    return index
+
+def score_matrix(results, cls, dims):
+    """
+    Stack consensus scores into one (n_results, n_cls, n_dims) float array.
+
+    Missing levels or dimensions are NaN. Built once per directory so every
+    statistic below is a column slice rather than a per-result dict lookup.
+    """
+    scores = np.full((len(results), len(cls), len(dims)), np.nan)
+    for i, r in enumerate(results):
+        index = index_by_cl(r)
+        for j, cl in enumerate(cls):
+            consensus = index.get(round(cl, 2))
+            if consensus is None:
+                continue
+            for k, d in enumerate(dims):
+                v = consensus.get(d)
+                if v is not None:
+                    scores[i, j, k] = v
+    return scores
 
 def main():
-    baseline = load_all(RESULTS_DIR)
-    ablation = load_all(ABLATION_DIR)
+    # Only scores are needed here; skip materializing responses and judge details
+    baseline = load_all_scores(RESULTS_DIR)
+    ablation = load_all_scores(ABLATION_DIR)
     print(f"Loaded {len(baseline)} baseline, {len(ablation)} ablation files")
 
     # --- Per-CL means (all models, excluding MiniMax) ---
     cls = [0.0, 0.25, 0.5, 0.75, 1.0]
     dims = ["CC", "SA", "FC"]
+    CL0, CL05, CL1 = cls.index(0.0), cls.index(0.5), cls.index(1.0)
+    CC, SA = dims.index("CC"), dims.index("SA")
+
+    # Columnar view of every file's scores, extracted once
+    baseline_scores = score_matrix(baseline, cls, dims)
+    ablation_scores = score_matrix(ablation, cls, dims)
+    not_minimax = np.fromiter(("MiniMax" not in r["subject_model"] for r in baseline), dtype=bool, count=len(baseline))
     
-    all_scores = {d: {cl: [] for cl in cls} for d in dims}
-    all_scores_no_minimax = {d: {cl: [] for cl in cls} for d in dims}
+    # Per-(CL, dim) stats straight off the NaN-padded matrix. Files go on the last,
+    # contiguous axis so each reduction keeps np.mean's pairwise summation.
+    no_minimax_scores = np.ascontiguousarray(np.moveaxis(baseline_scores[not_minimax], 0, -1))
+    cl_means = np.nanmean(no_minimax_scores, axis=-1)
+    cl_stds = np.nanstd(no_minimax_scores, axis=-1)
+    cl_counts = np.count_nonzero(~np.isnan(no_minimax_scores), axis=-1)
     
-    # U-curve detection
-    u_curve_all = 0
-    u_curve_no_minimax = 0
-    total_all = 0
-    total_no_minimax = 0
+    # U-curve: CC at 0.5 < CC at 0.0 AND CC at 0.5 < CC at 1.0
+    cc_0 = baseline_scores[:, CL0, CC]
+    cc_05 = baseline_scores[:, CL05, CC]
+    cc_1 = baseline_scores[:, CL1, CC]
+    sa_05 = baseline_scores[:, CL05, SA]
+    complete = ~(np.isnan(cc_0) | np.isnan(cc_05) | np.isnan(cc_1))
+    u_shaped = complete & (cc_05 < cc_0) & (cc_05 < cc_1)
+    total_all = complete.sum()
+    u_curve_all = u_shaped.sum()
+    total_no_minimax = (complete & not_minimax).sum()
+    u_curve_no_minimax = (u_shaped & not_minimax).sum()
     
     # For correlation
-    cc_at_05_all = []
-    sa_at_05_all = []
-    cc_at_05_no_minimax = []
-    sa_at_05_no_minimax = []
+    paired = ~(np.isnan(cc_05) | np.isnan(sa_05))
+    cc_at_05_all = cc_05[paired]
+    sa_at_05_all = sa_05[paired]
+    cc_at_05_no_minimax = cc_05[paired & not_minimax]
+    sa_at_05_no_minimax = sa_05[paired & not_minimax]
     
     # Agreement
     agreements = []
     cc_variances = []
     
     for r in baseline:
-        model = r["subject_model"]
-        is_minimax = "MiniMax" in model
-        
-        cc_0 = get_scores_at_cl(r, 0.0, "CC")
-        cc_05 = get_scores_at_cl(r, 0.5, "CC")
-        cc_1 = get_scores_at_cl(r, 1.0, "CC")
-        sa_05 = get_scores_at_cl(r, 0.5, "SA")
-        
-        # Collect per-CL scores
-        for cl in cls:
-            for d in dims:
-                v = get_scores_at_cl(r, cl, d)
-                if v is not None:
-                    all_scores[d][cl].append(v)
-                    if not is_minimax:
-                        all_scores_no_minimax[d][cl].append(v)
-        
-        # U-curve: CC at 0.5 < CC at 0.0 AND CC at 0.5 < CC at 1.0
-        if cc_0 is not None and cc_05 is not None and cc_1 is not None:
-            total_all += 1
-            if cc_05 < cc_0 and cc_05 < cc_1:
-                u_curve_all += 1
-            if not is_minimax:
-                total_no_minimax += 1
-                if cc_05 < cc_0 and cc_05 < cc_1:
-                    u_curve_no_minimax += 1
-        
-        # Correlation data
-        if cc_05 is not None and sa_05 is not None:
-            cc_at_05_all.append(cc_05)
-            sa_at_05_all.append(sa_05)
-            if not is_minimax:
-                cc_at_05_no_minimax.append(cc_05)
-                sa_at_05_no_minimax.append(sa_05)
-        
-        # Agreement metrics
         for p in r["performance"]:
-            je = p.get("jury_evaluation", {}).get("consensus", {})
+            # load_scores guarantees jury_evaluation.consensus on every entry
+            je = p["jury_evaluation"]["consensus"]
             if "agreement_score" in je:
                 agreements.append(je["agreement_score"])
             if "judge_variance_CC" in je:
                 cc_variances.append(je["judge_variance_CC"])
 
     # --- Ablation analysis ---
-    ablation_deltas = []
-    ablation_by_model = {}
+    # One flat row per matched (model, concept) pair
+    comparisons = []
     
     # Build baseline lookup: (model, concept) -> CC at CL=0.5
     baseline_lookup = {}
-    for r in baseline:
-        key = (r["subject_model"], r["concept"])
-        cc_05 = get_scores_at_cl(r, 0.5, "CC")
-        if cc_05 is not None:
-            baseline_lookup[key] = cc_05
+    for r, base_cc in zip(baseline, cc_05.tolist()):
+        if not np.isnan(base_cc):
+            baseline_lookup[(r["subject_model"], r["concept"])] = base_cc
     
-    for r in ablation:
-        key = (r["subject_model"], r["concept"])
-        abl_cc = get_scores_at_cl(r, 0.5, "CC")
-        base_cc = baseline_lookup.get(key)
-        if abl_cc is not None and base_cc is not None:
-            delta = abl_cc - base_cc
-            ablation_deltas.append(delta)
-            model = r["subject_model"]
-            if model not in ablation_by_model:
-                ablation_by_model[model] = {"baseline": [], "ablated": [], "deltas": []}
-            ablation_by_model[model]["baseline"].append(base_cc)
-            ablation_by_model[model]["ablated"].append(abl_cc)
-            ablation_by_model[model]["deltas"].append(delta)
+    for r, abl_cc in zip(ablation, ablation_scores[:, CL05, CC].tolist()):
+        base_cc = baseline_lookup.get((r["subject_model"], r["concept"]))
+        if not np.isnan(abl_cc) and base_cc is not None:
+            comparisons.append({
+                "model": r["subject_model"],
+                "concept": r["concept"],
+                "baseline": base_cc,
+                "ablated": abl_cc,
+            })
+
+    df = pd.DataFrame(comparisons, columns=["model", "concept", "baseline", "ablated"])
+    # Per-pair delta in one vectorized pass
+    df["delta"] = df["ablated"] - df["baseline"]
+    df.to_csv("ablation_comparison.csv", index=False)
+    ablation_deltas = df["delta"].to_numpy()
+    by_model = df.groupby("model")[["baseline", "ablated", "delta"]].mean()
 
     # --- Compute correlations ---
     r_all, p_all = stats.pearsonr(cc_at_05_all, sa_at_05_all)
@@ -131,30 +131,30 @@ def main():
             "excluding_minimax": {"count": u_curve_no_minimax, "total": total_no_minimax, "prevalence": u_curve_no_minimax / total_no_minimax if total_no_minimax else 0},
         },
         "mean_scores_by_cl": {
-            d: {str(cl): {"mean": float(np.mean(all_scores_no_minimax[d][cl])), "std": float(np.std(all_scores_no_minimax[d][cl])), "n": len(all_scores_no_minimax[d][cl])}
-                for cl in cls}
-            for d in dims
+            d: {str(cl): {"mean": cl_means[j, k], "std": cl_stds[j, k], "n": cl_counts[j, k]}
+                for j, cl in enumerate(cls)}
+            for k, d in enumerate(dims)
         },
         "correlation_cc_sa_at_05": {
-            "all_models": {"r": float(r_all), "p": float(p_all), "n": len(cc_at_05_all)},
-            "excluding_minimax": {"r": float(r_no_mm), "p": float(p_no_mm), "n": len(cc_at_05_no_minimax)},
+            "all_models": {"r": r_all, "p": p_all, "n": len(cc_at_05_all)},
+            "excluding_minimax": {"r": r_no_mm, "p": p_no_mm, "n": len(cc_at_05_no_minimax)},
         },
         "ablation": {
-            "mean_delta": float(np.mean(ablation_deltas)),
-            "median_delta": float(np.median(ablation_deltas)),
-            "positive_count": sum(1 for d in ablation_deltas if d > 0),
+            "mean_delta": np.mean(ablation_deltas),
+            "median_delta": np.median(ablation_deltas),
+            "positive_count": (ablation_deltas > 0).sum(),
             "total": len(ablation_deltas),
-            "by_model": {m: {"mean_baseline": float(np.mean(v["baseline"])), "mean_ablated": float(np.mean(v["ablated"])), "mean_delta": float(np.mean(v["deltas"]))}
-                         for m, v in sorted(ablation_by_model.items())},
+            "by_model": {str(m): {"mean_baseline": row.baseline, "mean_ablated": row.ablated, "mean_delta": row.delta}
+                         for m, row in by_model.iterrows()},
         },
         "jury_agreement": {
-            "mean_agreement": float(np.mean(agreements)),
-            "std_agreement": float(np.std(agreements)),
-            "mean_cc_variance": float(np.mean(cc_variances)),
+            "mean_agreement": np.mean(agreements),
+            "std_agreement": np.std(agreements),
+            "mean_cc_variance": np.mean(cc_variances),
         },
         "differential_sensitivity": {
-            "cc_drop_at_05": float(np.mean(all_scores_no_minimax["CC"][1.0]) - np.mean(all_scores_no_minimax["CC"][0.5])),
-            "sa_drop_at_05": float(np.mean(all_scores_no_minimax["SA"][1.0]) - np.mean(all_scores_no_minimax["SA"][0.5])),
+            "cc_drop_at_05": cl_means[CL1, CC] - cl_means[CL05, CC],
+            "sa_drop_at_05": cl_means[CL1, SA] - cl_means[CL05, SA],
         },
     }
     
@@ -163,31 +163,26 @@ def main():
     sa_drop = report["differential_sensitivity"]["sa_drop_at_05"]
     report["differential_sensitivity"]["ratio"] = cc_drop / sa_drop if sa_drop != 0 else float("inf")
 
-    with open("paper_statistics.json", "w") as f:
-        json.dump(report, f, indent=2)
+    write_json(report, "paper_statistics.json")
 
-    # Print summary
-    print("\n=== PAPER STATISTICS SUMMARY ===")
-    print(f"\nU-curve prevalence (all): {report['u_curve']['all_models']['count']}/{report['u_curve']['all_models']['total']} = {report['u_curve']['all_models']['prevalence']:.1%}")
-    print(f"U-curve prevalence (excl MiniMax): {report['u_curve']['excluding_minimax']['count']}/{report['u_curve']['excluding_minimax']['total']} = {report['u_curve']['excluding_minimax']['prevalence']:.1%}")
-    print(f"\nCC-SA correlation at CL=0.5 (all): r={r_all:.3f}, p={p_all:.4f}")
-    print(f"CC-SA correlation at CL=0.5 (excl MiniMax): r={r_no_mm:.3f}, p={p_no_mm:.4f}")
-    print(f"\nMean scores at CL=0.5 (excl MiniMax):")
-    for d in dims:
-        print(f"  {d}: {report['mean_scores_by_cl'][d]['0.5']['mean']:.3f} ± {report['mean_scores_by_cl'][d]['0.5']['std']:.3f}")
-    print(f"\nMean scores at CL=0.0 (excl MiniMax):")
-    for d in dims:
-        print(f"  {d}: {report['mean_scores_by_cl'][d]['0.0']['mean']:.3f} ± {report['mean_scores_by_cl'][d]['0.0']['std']:.3f}")
-    print(f"\nMean scores at CL=1.0 (excl MiniMax):")
-    for d in dims:
-        print(f"  {d}: {report['mean_scores_by_cl'][d]['1.0']['mean']:.3f} ± {report['mean_scores_by_cl'][d]['1.0']['std']:.3f}")
-    print(f"\nDifferential sensitivity: CC drop={cc_drop:.3f}, SA drop={sa_drop:.3f}, ratio={report['differential_sensitivity']['ratio']:.1f}x")
-    print(f"\nAblation: mean delta={report['ablation']['mean_delta']:.3f}, positive={report['ablation']['positive_count']}/{report['ablation']['total']}")
-    print(f"Jury agreement: mean={report['jury_agreement']['mean_agreement']:.3f}, CC variance={report['jury_agreement']['mean_cc_variance']:.3f}")
-    print(f"\nAblation by model:")
-    for m, v in sorted(report["ablation"]["by_model"].items()):
-        print(f"  {m}: baseline={v['mean_baseline']:.3f} → ablated={v['mean_ablated']:.3f} (Δ={v['mean_delta']:.3f})")
-    print(f"\n✓ Saved to paper_statistics.json")
+    # Build the summary once and emit it in a single write
+    lines = ["\n=== PAPER STATISTICS SUMMARY ==="]
+    lines.append(f"\nU-curve prevalence (all): {report['u_curve']['all_models']['count']}/{report['u_curve']['all_models']['total']} = {report['u_curve']['all_models']['prevalence']:.1%}")
+    lines.append(f"U-curve prevalence (excl MiniMax): {report['u_curve']['excluding_minimax']['count']}/{report['u_curve']['excluding_minimax']['total']} = {report['u_curve']['excluding_minimax']['prevalence']:.1%}")
+    lines.append(f"\nCC-SA correlation at CL=0.5 (all): r={r_all:.3f}, p={p_all:.4f}")
+    lines.append(f"CC-SA correlation at CL=0.5 (excl MiniMax): r={r_no_mm:.3f}, p={p_no_mm:.4f}")
+    for cl in ("0.5", "0.0", "1.0"):
+        lines.append(f"\nMean scores at CL={cl} (excl MiniMax):")
+        for d in dims:
+            lines.append(f"  {d}: {report['mean_scores_by_cl'][d][cl]['mean']:.3f} ± {report['mean_scores_by_cl'][d][cl]['std']:.3f}")
+    lines.append(f"\nDifferential sensitivity: CC drop={cc_drop:.3f}, SA drop={sa_drop:.3f}, ratio={report['differential_sensitivity']['ratio']:.1f}x")
+    lines.append(f"\nAblation: mean delta={report['ablation']['mean_delta']:.3f}, positive={report['ablation']['positive_count']}/{report['ablation']['total']}")
+    lines.append(f"Jury agreement: mean={report['jury_agreement']['mean_agreement']:.3f}, CC variance={report['jury_agreement']['mean_cc_variance']:.3f}")
+    lines.append(f"\nAblation by model:")
+    for m, v in report["ablation"]["by_model"].items():  # already in model order (groupby sorts keys)
+        lines.append(f"  {m}: baseline={v['mean_baseline']:.3f} → ablated={v['mean_ablated']:.3f} (Δ={v['mean_delta']:.3f})")
+    lines.append(f"\n✓ Saved to paper_statistics.json")
+    print("\n".join(lines))
 
 if __name__ == "__main__":
     main()
@@ -6,13 +6,20 @@ IFEval experiment pipeline for CDCT.
 - 3-model jury evaluation (CC/SA/FC)
 - Experiment runner with resume
 """
+import hashlib
 import json
 import os
 import re
 import time
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
+import numpy as np
 import requests
 
+from results_io import json_files, read_json, write_json
+from src.utils.response_cache import ResponseCache
+
 # ─── Configuration ───────────────────────────────────────────────────────────
 
 RESULTS_DIR = Path("results_ifeval")
@@ -21,6 +28,14 @@ SAMPLE_FILE = Path("ifeval_sample_200.json")
 
 COMPRESSION_LEVELS = [0.0, 0.25, 0.5, 0.75, 1.0]
 
+# Conditions run concurrently; each provider gets its own cap on in-flight requests
+MAX_WORKERS = int(os.getenv("IFEVAL_WORKERS", "16"))
+PROVIDER_CONCURRENCY = {"bedrock": 8, "featherless": 2}
+
+# Persistent response cache keyed by (provider, model, max_tokens, messages); IFEVAL_NO_CACHE=1 disables it
+RESPONSE_CACHE_FILE = RESULTS_DIR / "request_cache.sqlite"
+USE_RESPONSE_CACHE = os.getenv("IFEVAL_NO_CACHE") != "1"
+
 SUBJECT_MODELS = [
     {"name": "claude-sonnet-4.6", "model_id": "us.anthropic.claude-sonnet-4-6", "provider": "bedrock"},
     {"name": "DeepSeek-V3.2", "model_id": "deepseek.v3.2", "provider": "bedrock"},
@@ -59,43 +74,91 @@ CL_TARGETS = {
 
 COMPRESSION_MODEL = {"name": "nova-micro", "model_id": "amazon.nova-micro-v1:0", "provider": "bedrock"}
 
+# Post-processing patterns for compressor output, compiled once at import
+_LEAKED_CL_RE = re.compile(r'(?i)compression_level:\s*[\d.]+\s*')
+_LEAKED_TARGET_RE = re.compile(r'(?i)TARGET:.*?\n')
+_LEADING_LABEL_RE = re.compile(r'(?i)^(Task|Task context|Constraint clauses?|Constraints?|Output)\s*:\s*')
+_INLINE_LABEL_RE = re.compile(r'(?i)\n(Constraint clauses?|Constraints?)\s*:\s*')
+_ALL_CAPS_RE = re.compile(r'\b[A-Z]{2,}\b')
 
-def compress_with_agent(prompt, cl):
+
+def compress_with_agent(prompt, cl, use_cache=True):
     """Use LLM agent to compress prompt while preserving constraints."""
     if cl == 1.0:
         return prompt
     target = CL_TARGETS[cl]
     user_msg = f"TARGET: {target}\n\nORIGINAL PROMPT:\n{prompt}"
     messages = [{"role": "user", "content": f"{COMPRESSION_AGENT_SYSTEM}\n\n{user_msg}"}]
-    result = call_model(COMPRESSION_MODEL, messages, max_tokens=1024)
+    result = call_model(COMPRESSION_MODEL, messages, max_tokens=1024, use_cache=use_cache)
     # Strip leaked metadata
-    result = re.sub(r'(?i)compression_level:\s*[\d.]+\s*', '', result)
-    result = re.sub(r'(?i)TARGET:.*?\n', '', result)
+    result = _LEAKED_CL_RE.sub('', result)
+    result = _LEAKED_TARGET_RE.sub('', result)
     # Strip structural labels
-    result = re.sub(r'(?i)^(Task|Task context|Constraint clauses?|Constraints?|Output)\s*:\s*', '', result)
-    result = re.sub(r'(?i)\n(Constraint clauses?|Constraints?)\s*:\s*', '\n', result)
+    result = _LEADING_LABEL_RE.sub('', result)
+    result = _INLINE_LABEL_RE.sub('\n', result)
     # Force-lowercase any ALL-CAPS words (2+ chars, all alpha, all upper)
     def decaps(m):
         word = m.group(0)
         if len(word) >= 2 and word.isalpha() and word == word.upper():
             return word.lower()
         return word
-    result = re.sub(r'\b[A-Z]{2,}\b', decaps, result)
+    result = _ALL_CAPS_RE.sub(decaps, result)
     return result.strip().strip('"')
 
 
+def _compress_entry(entry):
+    """Fill in one prompt's missing CLs and enforce monotonicity. Returns (compressions, calls made)."""
+    compressions = dict(entry["compressions"])
+    calls = 0
+    for cl in COMPRESSION_LEVELS:
+        cl_key = str(cl)
+        if cl_key in compressions:
+            continue
+        calls += 1
+        try:
+            compressions[cl_key] = compress_with_agent(entry["original_prompt"], cl)
+        except Exception as e:
+            print(f"    ✗ key={entry['key']} cl={cl}: {e}")
+            compressions[cl_key] = None
+
+    # Monotonicity check: word count should increase with CL
+    # If violated, retry the offending level (max 2 retries)
+    for _retry in range(2):
+        wcs = []
+        for cl in COMPRESSION_LEVELS:
+            v = compressions.get(str(cl))
+            wcs.append(len(v.split()) if v else 0)
+        monotonic = all(wcs[i] <= wcs[i+1] for i in range(len(wcs)-1))
+        if monotonic:
+            break
+        # Find first violation and regenerate the LOWER CL (the one that's too long)
+        for i in range(len(wcs)-1):
+            if wcs[i] > wcs[i+1] and COMPRESSION_LEVELS[i] != 1.0:
+                cl_fix = COMPRESSION_LEVELS[i]
+                try:
+                    # Bypass the cache so the retry gets a fresh sample
+                    compressions[str(cl_fix)] = compress_with_agent(
+                        entry["original_prompt"], cl_fix, use_cache=False
+                    )
+                    calls += 1
+                except:
+                    pass
+                break
+
+    return compressions, calls
+
+
 def build_compressed_prompts():
     """Compress all 200 prompts at 5 CLs using LLM agent. Saves incrementally. Enforces monotonicity."""
     if COMPRESSED_PROMPTS_FILE.exists():
-        compressed = json.loads(COMPRESSED_PROMPTS_FILE.read_text())
+        compressed = read_json(COMPRESSED_PROMPTS_FILE)
         incomplete = [e for e in compressed if len(e["compressions"]) < len(COMPRESSION_LEVELS)]
         if not incomplete:
             print(f"✓ Compressed prompts already complete: {COMPRESSED_PROMPTS_FILE}")
             return compressed
         print(f"  Resuming compression: {len(incomplete)} prompts incomplete")
     else:
-        with open(SAMPLE_FILE) as f:
-            sample = json.load(f)
+        sample = read_json(SAMPLE_FILE)
         compressed = []
         for p in sample:
             compressed.append({
@@ -110,44 +173,22 @@ def build_compressed_prompts():
     done = 0
     print(f"  Compressing {len(compressed)} prompts ({total_calls} LLM calls needed)...")
 
-    for entry in compressed:
-        for cl in COMPRESSION_LEVELS:
-            cl_key = str(cl)
-            if cl_key in entry["compressions"]:
+    # Prompts are independent, so they are compressed concurrently; only this
+    # thread mutates `compressed` and writes the checkpoint
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        futures = {executor.submit(_compress_entry, entry): entry for entry in compressed}
+        for finished, future in enumerate(as_completed(futures), 1):
+            entry = futures[future]
+            compressions, calls = future.result()
+            if not calls:
                 continue
-            done += 1
-            try:
-                result = compress_with_agent(entry["original_prompt"], cl)
-                entry["compressions"][cl_key] = result
-                if done % 10 == 0:
-                    print(f"    [{done}/{total_calls}] key={entry['key']} cl={cl}")
-            except Exception as e:
-                print(f"    ✗ key={entry['key']} cl={cl}: {e}")
-                entry["compressions"][cl_key] = None
-
-        # Monotonicity check: word count should increase with CL
-        # If violated, retry the offending level (max 2 retries)
-        for _retry in range(2):
-            wcs = []
-            for cl in COMPRESSION_LEVELS:
-                v = entry["compressions"].get(str(cl))
-                wcs.append(len(v.split()) if v else 0)
-            monotonic = all(wcs[i] <= wcs[i+1] for i in range(len(wcs)-1))
-            if monotonic:
-                break
-            # Find first violation and regenerate the LOWER CL (the one that's too long)
-            for i in range(len(wcs)-1):
-                if wcs[i] > wcs[i+1] and COMPRESSION_LEVELS[i] != 1.0:
-                    cl_fix = COMPRESSION_LEVELS[i]
-                    try:
-                        entry["compressions"][str(cl_fix)] = compress_with_agent(entry["original_prompt"], cl_fix)
-                        done += 1
-                    except:
-                        pass
-                    break
-
-        # Save after each prompt
-        COMPRESSED_PROMPTS_FILE.write_text(json.dumps(compressed, indent=2))
+            entry["compressions"] = compressions
+            done += calls
+            if finished % 10 == 0:
+                print(f"    [{finished}/{len(compressed)} prompts, {done} calls] key={entry['key']}")
+
+            # Save after each prompt
+            write_json(compressed, COMPRESSED_PROMPTS_FILE)
 
     failures = sum(1 for e in compressed for v in e["compressions"].values() if v is None)
     print(f"✓ Compression complete. {done} calls made, {failures} failures → {COMPRESSED_PROMPTS_FILE}")
@@ -170,6 +211,18 @@ def _load_env():
 ENV = _load_env()
 
 
+def _make_session(pool_size):
+    """Keep-alive session whose connection pool matches the provider's concurrency cap."""
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    return session
+
+
+# One session per provider so TCP/TLS connections are reused across calls
+_SESSIONS = {p: _make_session(n) for p, n in PROVIDER_CONCURRENCY.items()}
+
+
 def call_bedrock(model_id, messages, max_tokens=2048):
     url = f"https://bedrock-runtime.us-east-1.amazonaws.com/model/{model_id}/converse"
     # Bedrock Converse API: system prompt goes in separate 'system' field
@@ -190,7 +243,7 @@ def call_bedrock(model_id, messages, max_tokens=2048):
 
     for attempt in range(5):
         try:
-            resp = requests.post(
+            resp = _SESSIONS["bedrock"].post(
                 url,
                 headers={"Content-Type": "application/json", "Authorization": f"Bearer {ENV['AWS_BEARER_TOKEN_BEDROCK']}"},
                 json=body, timeout=300,
@@ -216,7 +269,7 @@ def call_featherless(model_id, messages, max_tokens=2048):
     body = {"model": model_id, "messages": messages, "temperature": 0.0, "max_tokens": max_tokens}
     for attempt in range(5):
         try:
-            resp = requests.post(
+            resp = _SESSIONS["featherless"].post(
                 url,
                 headers={"Content-Type": "application/json", "Authorization": f"Bearer {ENV['FEATHERLESS_API_KEY']}"},
                 json=body, timeout=300,
@@ -233,12 +286,48 @@ def call_featherless(model_id, messages, max_tokens=2048):
     raise RuntimeError(f"Featherless call failed after 5 attempts: {model_id}")
 
 
-def call_model(model_config, messages, max_tokens=2048):
-    if model_config["provider"] == "bedrock":
-        return call_bedrock(model_config["model_id"], messages, max_tokens)
-    elif model_config["provider"] == "featherless":
-        return call_featherless(model_config["model_id"], messages, max_tokens)
-    raise ValueError(f"Unknown provider: {model_config['provider']}")
+_PROVIDER_SEMAPHORES = {p: threading.Semaphore(n) for p, n in PROVIDER_CONCURRENCY.items()}
+
+
+def call_model(model_config, messages, max_tokens=2048, use_cache=True, cache_if=None):
+    """
+    Call a model, replaying a cached response for an identical request.
+
+    use_cache=False skips the lookup (the fresh response is still stored);
+    cache_if, when given, must accept the response for it to be stored.
+    """
+    provider = model_config["provider"]
+    if provider not in _PROVIDER_SEMAPHORES:
+        raise ValueError(f"Unknown provider: {provider}")
+
+    key = response_cache_key(model_config, messages, max_tokens) if USE_RESPONSE_CACHE else None
+    if key and use_cache:
+        cached = _response_cache.get(key)
+        if cached is not None:
+            return cached
+
+    with _PROVIDER_SEMAPHORES[provider]:
+        if provider == "bedrock":
+            response = call_bedrock(model_config["model_id"], messages, max_tokens)
+        else:
+            response = call_featherless(model_config["model_id"], messages, max_tokens)
+
+    if key and (cache_if is None or cache_if(response)):
+        _response_cache.put(key, response)
+    return response
+
+
+# ─── Response Cache ──────────────────────────────────────────────────────────
+
+# Failures disable the cache for the run rather than failing the call
+_response_cache = ResponseCache(RESPONSE_CACHE_FILE)
+
+
+def response_cache_key(model_config, messages, max_tokens):
+    payload = json.dumps(
+        [model_config["provider"], model_config["model_id"], max_tokens, messages], sort_keys=True
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
 
 
 # ─── IFEval Heuristic Verifier ───────────────────────────────────────────────
@@ -256,8 +345,12 @@ def verify_word_count(response, kwargs):
     return None
 
 
+_SENTENCE_END_RE = re.compile(r'[.!?]+')
+_CODE_FENCE_OPEN_RE = re.compile(r'```(?:json|JSON)?\s*')
+
+
 def verify_sentence_count(response, kwargs):
-    sents = len([s for s in re.split(r'[.!?]+', response) if s.strip()])
+    sents = len([s for s in _SENTENCE_END_RE.split(response) if s.strip()])
     relation = kwargs.get("relation", "at least")
     num = kwargs.get("num_sentences")
     if num is None:
@@ -300,8 +393,8 @@ def verify_capital_word_frequency(response, kwargs):
 
 
 def verify_json_format(response, _kwargs):
-    text = re.sub(r'```(?:json|JSON)?\s*', '', response)
-    text = re.sub(r'```', '', text).strip()
+    text = _CODE_FENCE_OPEN_RE.sub('', response)
+    text = text.replace('```', '').strip()
     try:
         json.loads(text)
         return True
@@ -400,10 +493,7 @@ DIMENSIONS:
 OUTPUT FORMAT (strict JSON, nothing else):
 {"CC": 0.0, "SA": 0.0, "FC": 0.0}"""
 
-
-def evaluate_with_jury(original_prompt, compressed_prompt, response):
-    """Run 3-model jury evaluation. Returns consensus scores + per-judge breakdown."""
-    user_content = f"""ORIGINAL PROMPT:
+JURY_USER_TEMPLATE = """ORIGINAL PROMPT:
 {original_prompt}
 
 COMPRESSED PROMPT GIVEN TO MODEL:
@@ -414,52 +504,83 @@ MODEL RESPONSE:
 
 Score this response. Output ONLY the JSON: {{"CC": ..., "SA": ..., "FC": ...}}"""
 
+# Strict score object first, then any flat JSON object as a fallback
+_JURY_SCORES_RE = re.compile(r'\{\s*"CC"\s*:\s*([\d.]+)\s*,\s*"SA"\s*:\s*([\d.]+)\s*,\s*"FC"\s*:\s*([\d.]+)\s*\}')
+_JSON_OBJECT_RE = re.compile(r'\{[^}]+\}')
+
+
+def _parse_jury_scores(raw):
+    """CC/SA/FC scores from a jury reply, or None if it holds no JSON object."""
+    match = _JURY_SCORES_RE.search(raw)
+    if match:
+        return {
+            "CC": float(match.group(1)),
+            "SA": float(match.group(2)),
+            "FC": float(match.group(3)),
+        }
+    # Try generic JSON parse
+    jmatch = _JSON_OBJECT_RE.search(raw)
+    if jmatch:
+        scores = json.loads(jmatch.group())
+        return {
+            "CC": float(scores.get("CC", 0)),
+            "SA": float(scores.get("SA", 0)),
+            "FC": float(scores.get("FC", 0)),
+        }
+    return None
+
+
+def _is_scoreable(raw):
+    """Only jury replies that parse to scores are cached, so malformed ones are retried."""
+    try:
+        return _parse_jury_scores(raw) is not None
+    except (ValueError, TypeError, AttributeError):
+        return False
+
+
+def _judge(jury_model, messages):
+    """Score one response with one jury model; errors and unparseable output score 0."""
+    try:
+        raw = call_model(jury_model, messages, max_tokens=200, cache_if=_is_scoreable)
+        # Parse JSON from response — handle partial/malformed
+        scores = _parse_jury_scores(raw)
+        if scores is not None:
+            return scores
+        return {"CC": 0.0, "SA": 0.0, "FC": 0.0, "parse_error": raw[:200]}
+    except Exception as e:
+        return {"CC": 0.0, "SA": 0.0, "FC": 0.0, "error": str(e)}
+
+
+def evaluate_with_jury(original_prompt, compressed_prompt, response):
+    """Run 3-model jury evaluation. Returns consensus scores + per-judge breakdown."""
+    user_content = JURY_USER_TEMPLATE.format_map({
+        "original_prompt": original_prompt,
+        "compressed_prompt": compressed_prompt,
+        "response": response,
+    })
     messages = [
         {"role": "system", "content": JURY_SYSTEM_PROMPT},
         {"role": "user", "content": user_content},
     ]
 
-    judges = {}
-    for jury_model in JURY_MODELS:
-        try:
-            raw = call_model(jury_model, messages, max_tokens=200)
-            # Parse JSON from response — handle partial/malformed
-            match = re.search(r'\{\s*"CC"\s*:\s*([\d.]+)\s*,\s*"SA"\s*:\s*([\d.]+)\s*,\s*"FC"\s*:\s*([\d.]+)\s*\}', raw)
-            if match:
-                judges[jury_model["name"]] = {
-                    "CC": float(match.group(1)),
-                    "SA": float(match.group(2)),
-                    "FC": float(match.group(3)),
-                }
-            else:
-                # Try generic JSON parse
-                jmatch = re.search(r'\{[^}]+\}', raw)
-                if jmatch:
-                    scores = json.loads(jmatch.group())
-                    judges[jury_model["name"]] = {
-                        "CC": float(scores.get("CC", 0)),
-                        "SA": float(scores.get("SA", 0)),
-                        "FC": float(scores.get("FC", 0)),
-                    }
-                else:
-                    judges[jury_model["name"]] = {"CC": 0.0, "SA": 0.0, "FC": 0.0, "parse_error": raw[:200]}
-        except Exception as e:
-            judges[jury_model["name"]] = {"CC": 0.0, "SA": 0.0, "FC": 0.0, "error": str(e)}
-        time.sleep(0.5)  # Throttle between jury calls
-
-    # Compute consensus (mean of 3 judges)
-    cc_scores = [j["CC"] for j in judges.values()]
-    sa_scores = [j["SA"] for j in judges.values()]
-    fc_scores = [j["FC"] for j in judges.values()]
-
-    import numpy as np
+    # Judges are independent; query them concurrently (call_model's provider
+    # semaphores cap in-flight requests) and keep JURY_MODELS order
+    with ThreadPoolExecutor(max_workers=len(JURY_MODELS)) as executor:
+        verdicts = executor.map(lambda m: _judge(m, messages), JURY_MODELS)
+        judges = {m["name"]: v for m, v in zip(JURY_MODELS, verdicts)}
+
+    # Compute consensus (mean of 3 judges): one judges x (CC, SA, FC) matrix,
+    # reduced column-wise in a single call each
+    scores = np.array([[j["CC"], j["SA"], j["FC"]] for j in judges.values()], dtype=np.float64)
+    means = scores.mean(axis=0)
+    stds = scores.std(axis=0)
     consensus = {
-        "CC": float(np.mean(cc_scores)),
-        "SA": float(np.mean(sa_scores)),
-        "FC": float(np.mean(fc_scores)),
-        "judge_variance_CC": float(np.std(cc_scores)),
-        "judge_variance_SA": float(np.std(sa_scores)),
-        "judge_variance_FC": float(np.std(fc_scores)),
+        "CC": float(means[0]),
+        "SA": float(means[1]),
+        "FC": float(means[2]),
+        "judge_variance_CC": float(stds[0]),
+        "judge_variance_SA": float(stds[1]),
+        "judge_variance_FC": float(stds[2]),
     }
 
     return {"judges": judges, "consensus": consensus}
@@ -471,19 +592,77 @@ def result_path(prompt_key, model_name, cl):
     return RESULTS_DIR / f"{prompt_key}_{model_name}_{cl}.json"
 
 
-def is_complete(rp):
-    """Check if a result file exists and is not an error."""
+def is_complete(rp, compressed_prompt=None, with_jury=False):
+    """Check if a result file exists, is not an error, and matches the current condition.
+
+    A file written for a different compressed prompt (e.g. after recompression)
+    or lacking a jury evaluation that is now requested is treated as incomplete.
+    """
     if not rp.exists():
         return False
     try:
-        existing = json.loads(rp.read_text())
-        return "error" not in existing
+        existing = read_json(rp)
     except:
         return False
+    if "error" in existing:
+        return False
+    if compressed_prompt is not None and existing.get("compressed_prompt") != compressed_prompt:
+        return False
+    if with_jury and not existing.get("jury_evaluation"):
+        return False
+    return True
+
+
+def run_condition(prompt_data, model, cl, compressed_prompt, rp, with_jury=False):
+    """Run one (prompt, model, CL) condition and write its result file. Returns a status string."""
+    key = prompt_data["key"]
+    try:
+        response = call_model(model, [{"role": "user", "content": compressed_prompt}])
+
+        # Heuristic verification
+        verification = verify_constraints(
+            response, prompt_data["instruction_id_list"], prompt_data["kwargs"]
+        )
+        heuristic_cc = compute_heuristic_cc(verification)
+
+        result = {
+            "key": key,
+            "model": model["name"],
+            "compression_level": cl,
+            "compressed_prompt": compressed_prompt,
+            "compressed_word_count": len(compressed_prompt.split()),
+            "response": response,
+            "response_word_count": len(response.split()),
+            "instruction_id_list": prompt_data["instruction_id_list"],
+            "heuristic_verification": verification,
+            "heuristic_cc": heuristic_cc,
+        }
+
+        status = f"hcc={heuristic_cc:.2f}" if heuristic_cc is not None else "hcc=N/A"
+
+        # Jury evaluation (optional, expensive)
+        if with_jury:
+            jury_result = evaluate_with_jury(
+                prompt_data["original_prompt"], compressed_prompt, response
+            )
+            result["jury_evaluation"] = jury_result
+            status += f" jcc={jury_result['consensus']['CC']:.2f}"
+
+        write_json(result, rp)
+        return f"✓ {status} ({len(response.split())}w)"
+
+    except Exception as e:
+        error_result = {"key": key, "model": model["name"], "compression_level": cl, "error": str(e)}
+        write_json(error_result, rp)
+        return f"✗ {e}"
 
 
 def run_experiment(prompts=None, models=None, cls=None, dry_run=False, with_jury=False):
-    """Run the IFEval experiment with resume support."""
+    """Run the IFEval experiment with resume support.
+
+    Conditions are independent, so they are dispatched to a thread pool of
+    MAX_WORKERS; per-provider concurrency is capped inside call_model.
+    """
     RESULTS_DIR.mkdir(exist_ok=True)
 
     if prompts is None:
@@ -501,17 +680,18 @@ def run_experiment(prompts=None, models=None, cls=None, dry_run=False, with_jury
     if with_jury:
         print("  Jury evaluation: ENABLED (3 judges per condition)")
 
+    tasks = []
     for prompt_data in prompts:
         key = prompt_data["key"]
         for model in models:
             for cl in cls:
                 rp = result_path(key, model["name"], cl)
-                if is_complete(rp):
+                compressed_prompt = prompt_data["compressions"].get(str(cl))
+                if is_complete(rp, compressed_prompt, with_jury):
                     skipped += 1
                     continue
 
                 done += 1
-                compressed_prompt = prompt_data["compressions"].get(str(cl))
                 if compressed_prompt is None:
                     continue  # Skip failed compressions
 
@@ -519,49 +699,20 @@ def run_experiment(prompts=None, models=None, cls=None, dry_run=False, with_jury
                     print(f"  [DRY] key={key} model={model['name']} cl={cl} | {len(compressed_prompt.split())}w")
                     continue
 
-                print(f"  [{done}/{total-skipped}] key={key} model={model['name']} cl={cl}", end="", flush=True)
+                tasks.append((prompt_data, model, cl, compressed_prompt, rp))
 
-                try:
-                    response = call_model(model, [{"role": "user", "content": compressed_prompt}])
+    if tasks:
+        print(f"  Dispatching {len(tasks)} conditions across {MAX_WORKERS} workers")
 
-                    # Heuristic verification
-                    verification = verify_constraints(
-                        response, prompt_data["instruction_id_list"], prompt_data["kwargs"]
-                    )
-                    heuristic_cc = compute_heuristic_cc(verification)
-
-                    result = {
-                        "key": key,
-                        "model": model["name"],
-                        "compression_level": cl,
-                        "compressed_prompt": compressed_prompt,
-                        "compressed_word_count": len(compressed_prompt.split()),
-                        "response": response,
-                        "response_word_count": len(response.split()),
-                        "instruction_id_list": prompt_data["instruction_id_list"],
-                        "heuristic_verification": verification,
-                        "heuristic_cc": heuristic_cc,
-                    }
-
-                    # Jury evaluation (optional, expensive)
-                    if with_jury:
-                        jury_result = evaluate_with_jury(
-                            prompt_data["original_prompt"], compressed_prompt, response
-                        )
-                        result["jury_evaluation"] = jury_result
-                        jury_cc = jury_result["consensus"]["CC"]
-                        print(f" ✓ hcc={heuristic_cc:.2f}" if heuristic_cc is not None else " ✓ hcc=N/A", end="")
-                        print(f" jcc={jury_cc:.2f} ({len(response.split())}w)")
-                    else:
-                        status = f"hcc={heuristic_cc:.2f}" if heuristic_cc is not None else "hcc=N/A"
-                        print(f" ✓ {status} ({len(response.split())}w)")
-
-                    rp.write_text(json.dumps(result, indent=2))
-
-                except Exception as e:
-                    print(f" ✗ {e}")
-                    error_result = {"key": key, "model": model["name"], "compression_level": cl, "error": str(e)}
-                    rp.write_text(json.dumps(error_result, indent=2))
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        futures = {
+            executor.submit(run_condition, prompt_data, model, cl, compressed_prompt, rp, with_jury):
+                (prompt_data["key"], model["name"], cl)
+            for prompt_data, model, cl, compressed_prompt, rp in tasks
+        }
+        for finished, future in enumerate(as_completed(futures), 1):
+            key, model_name, cl = futures[future]
+            print(f"  [{finished}/{len(tasks)}] key={key} model={model_name} cl={cl} {future.result()}")
 
     print(f"\n=== Done. Completed: {done}, Skipped (already done): {skipped} ===")
 
@@ -578,8 +729,8 @@ def run_mini_experiment():
     # Print summary
     print("\n=== MINI EXPERIMENT RESULTS ===")
     results = []
-    for f in RESULTS_DIR.glob("*.json"):
-        r = json.loads(f.read_text())
+    for f in json_files(RESULTS_DIR):
+        r = read_json(f)
         if "error" not in r:
             results.append(r)
 
@@ -587,23 +738,25 @@ def run_mini_experiment():
         print("No successful results.")
         return
 
-    by_cl = {}
-    for r in results:
-        cl = r["compression_level"]
-        if cl not in by_cl:
-            by_cl[cl] = {"hcc": [], "jcc": []}
-        if r.get("heuristic_cc") is not None:
-            by_cl[cl]["hcc"].append(r["heuristic_cc"])
-        if r.get("jury_evaluation"):
-            by_cl[cl]["jcc"].append(r["jury_evaluation"]["consensus"]["CC"])
+    # Group by CL via integer codes; missing scores are NaN and masked out of each group
+    levels, codes = np.unique([r["compression_level"] for r in results], return_inverse=True)
+    hcc = np.array([r["heuristic_cc"] if r.get("heuristic_cc") is not None else np.nan for r in results])
+    jcc = np.array([r["jury_evaluation"]["consensus"]["CC"] if r.get("jury_evaluation") else np.nan for r in results])
+
+    def grouped(values):
+        present = ~np.isnan(values)
+        sums = np.bincount(codes[present], weights=values[present], minlength=len(levels))
+        counts = np.bincount(codes[present], minlength=len(levels))
+        return sums, counts
+
+    hcc_sums, hcc_counts = grouped(hcc)
+    jcc_sums, jcc_counts = grouped(jcc)
 
     print(f"\n{'CL':<6} {'Heuristic CC':<15} {'Jury CC':<15}")
     print("-" * 36)
-    for cl in sorted(by_cl.keys()):
-        hcc = by_cl[cl]["hcc"]
-        jcc = by_cl[cl]["jcc"]
-        h_str = f"{sum(hcc)/len(hcc):.3f} (n={len(hcc)})" if hcc else "N/A"
-        j_str = f"{sum(jcc)/len(jcc):.3f} (n={len(jcc)})" if jcc else "N/A"
+    for i, cl in enumerate(levels.tolist()):
+        h_str = f"{hcc_sums[i]/hcc_counts[i]:.3f} (n={hcc_counts[i]})" if hcc_counts[i] else "N/A"
+        j_str = f"{jcc_sums[i]/jcc_counts[i]:.3f} (n={jcc_counts[i]})" if jcc_counts[i] else "N/A"
         print(f"{cl:<6} {h_str:<15} {j_str:<15}")
 
 
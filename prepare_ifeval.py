@@ -2,31 +2,39 @@
 Download IFEval, analyze instruction type distribution, produce stratified sample of 200 prompts.
 Then test constraint-preserving compression on 15 sample prompts.
 """
-import json
 from collections import Counter
+import numpy as np
 from datasets import load_dataset
 
+from results_io import write_json
+
 def main():
     ds = load_dataset("google/IFEval", split="train")
     print(f"Total IFEval prompts: {len(ds)}")
 
+    # Read the column once rather than materializing a dict per row
+    instruction_ids = ds["instruction_id_list"]
+
     # Analyze instruction type distribution
     type_counter = Counter()
-    for row in ds:
-        for iid in row["instruction_id_list"]:
-            type_counter[iid] += 1
+    for ids in instruction_ids:
+        type_counter.update(ids)
 
     print(f"\n=== Instruction Types ({len(type_counter)} unique) ===")
     for itype, count in type_counter.most_common():
         print(f"  {itype}: {count}")
 
     # Group prompts by their PRIMARY instruction type (first in list)
-    by_primary_type = {}
-    for i, row in enumerate(ds):
-        primary = row["instruction_id_list"][0]
-        if primary not in by_primary_type:
-            by_primary_type[primary] = []
-        by_primary_type[primary].append(i)
+    # One stable argsort by type code; group boundaries come from searchsorted
+    ptypes, first_seen, codes = np.unique(
+        [ids[0] for ids in instruction_ids], return_index=True, return_inverse=True
+    )
+    order = np.argsort(codes, kind="stable")
+    bounds = np.searchsorted(codes[order], np.arange(len(ptypes) + 1))
+    by_primary_type = {
+        str(ptypes[g]): order[bounds[g]:bounds[g + 1]].tolist()
+        for g in np.argsort(first_seen)  # keep first-seen type order
+    }
 
     print(f"\n=== Primary Instruction Types ({len(by_primary_type)}) ===")
     for ptype, indices in sorted(by_primary_type.items(), key=lambda x: -len(x[1])):
@@ -68,8 +76,7 @@ def main():
     print(f"Types covered in sample: {len(sample_types)}/{len(type_counter)}")
 
     # Save
-    with open("ifeval_sample_200.json", "w") as f:
-        json.dump(sample, f, indent=2)
+    write_json(sample, "ifeval_sample_200.json")
     print(f"\n✓ Saved {len(sample)} prompts to ifeval_sample_200.json")
 
     # Print 15 example prompts for manual compression testing
@@ -85,8 +92,7 @@ def main():
             print(f"  Text: {p['prompt'][:200]}...")
             test_prompts.append(p)
 
-    with open("ifeval_compression_test_15.json", "w") as f:
-        json.dump(test_prompts, f, indent=2)
+    write_json(test_prompts, "ifeval_compression_test_15.json")
     print(f"\n✓ Saved 15 test prompts to ifeval_compression_test_15.json")
 
 if __name__ == "__main__":
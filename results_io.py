@@ -0,0 +1,182 @@
+"""Shared JSON I/O for result files (results_jury/, results_jury_ablation/, results_ifeval/)."""
+import json
+import os
+from operator import attrgetter
+from concurrent.futures import ThreadPoolExecutor
+
+# Optional fast parser/serializer: falls back to the stdlib json module
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Optional streaming parser: lets score-only consumers skip materializing responses
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+HEADER_FIELDS = ("subject_model", "concept")
+
+# Result files are independent; parsing them on a small pool overlaps file I/O
+LOAD_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Memoized load_scores projections, keyed by result-file path + mtime + size
+SCORES_CACHE_FILE = ".scores_cache.json"
+# Bump whenever load_scores/_project_entry change shape, so old entries miss
+SCORES_CACHE_VERSION = 1
+
+
+def read_json(path):
+    """Parse a JSON file, using orjson when installed."""
+    if ORJSON_AVAILABLE:
+        with open(path, "rb") as fh:
+            return orjson.loads(fh.read())
+    with open(path) as fh:
+        return json.load(fh)
+
+
+def _to_builtin(obj):
+    """json.dump fallback for NumPy scalars and arrays."""
+    if hasattr(obj, "tolist"):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def write_json(obj, path):
+    """
+    Write obj as 2-space indented JSON, using orjson when installed.
+
+    NumPy scalars and arrays are serialized directly, so callers need not
+    cast statistics to float/int first. Note: orjson writes non-finite
+    floats (nan, inf) as null. The file is written to a temporary sibling
+    and renamed into place, so an interrupted write never leaves a
+    truncated file for resume checks to pick up.
+    """
+    tmp = f"{os.fspath(path)}.tmp"
+    try:
+        if ORJSON_AVAILABLE:
+            with open(tmp, "wb") as fh:
+                fh.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+        else:
+            with open(tmp, "w") as fh:
+                json.dump(obj, fh, indent=2, default=_to_builtin)
+    except BaseException:
+        # Don't leave a partial temp file behind when serialization fails
+        try:
+            os.unlink(tmp)
+        except FileNotFoundError:
+            pass
+        raise
+    os.replace(tmp, path)
+
+
+def _json_entries(directory):
+    """
+    Regular .json files in a directory as os.DirEntry objects, sorted by name.
+
+    Uses a single os.scandir pass; the name filter runs before the is_file
+    check, so non-JSON entries never cost a stat.
+    """
+    with os.scandir(directory) as it:
+        return sorted((e for e in it if e.name.endswith(".json") and e.is_file()), key=attrgetter("name"))
+
+
+def json_files(directory):
+    """Sorted paths of the regular .json files in a directory."""
+    return [e.path for e in _json_entries(directory)]
+
+
+def iter_all(directory):
+    """
+    Yield every result file in a directory in full, one at a time.
+
+    Only the current file's responses are held in memory.
+    """
+    for f in json_files(directory):
+        yield read_json(f)
+
+
+def _load_parallel(loader, files):
+    """Apply loader to every file on a thread pool, keeping input order."""
+    with ThreadPoolExecutor(max_workers=min(LOAD_WORKERS, max(len(files), 1))) as executor:
+        return list(executor.map(loader, files))
+
+
+def _project_entry(p):
+    """Keep only the compression level and jury consensus of a performance entry."""
+    return {
+        "compression_level": p["compression_level"],
+        "jury_evaluation": {"consensus": p["jury_evaluation"]["consensus"]},
+    }
+
+
+def _stream_scores(path):
+    with open(path, "rb") as fh:
+        # Header fields precede the performance array, so stop as soon as they are seen
+        record = {}
+        for prefix, event, value in ijson.parse(fh):
+            if prefix in HEADER_FIELDS:
+                record[prefix] = value
+                if len(record) == len(HEADER_FIELDS):
+                    break
+        fh.seek(0)
+        record["performance"] = [
+            _project_entry(p) for p in ijson.items(fh, "performance.item", use_float=True)
+        ]
+    return record
+
+
+def load_scores(path):
+    """
+    Load a result file projected to subject_model, concept and per-CL consensus.
+
+    Responses and per-judge verdicts are dropped, so memory stays proportional
+    to the scores rather than to the full file.
+    """
+    if IJSON_AVAILABLE:
+        return _stream_scores(path)
+    data = read_json(path)
+    record = {k: data.get(k) for k in HEADER_FIELDS}
+    record["performance"] = [_project_entry(p) for p in data["performance"]]
+    return record
+
+
+def _read_scores_cache(cache_file):
+    try:
+        return read_json(cache_file)
+    except (OSError, ValueError):
+        return {}
+
+
+def load_all_scores(directory, cache_file=SCORES_CACHE_FILE):
+    """
+    Load every result file in a directory via load_scores.
+
+    Projections are memoized in cache_file keyed by path, mtime, size and
+    SCORES_CACHE_VERSION, so unchanged files are not re-parsed on later runs.
+    Entries for files no longer in the directory are dropped. Pass
+    cache_file=None to disable the cache.
+    """
+    entries = _json_entries(directory)
+    files = [e.path for e in entries]
+    if cache_file is None:
+        return _load_parallel(load_scores, files)
+
+    cache = _read_scores_cache(cache_file)
+    # DirEntry.stat() reuses the directory scan's data where the OS provides it
+    stamps = {}
+    for e in entries:
+        st = e.stat()
+        stamps[e.path] = [SCORES_CACHE_VERSION, st.st_mtime_ns, st.st_size]
+    stale = [f for f in files if cache.get(f, {}).get("stamp") != stamps[f]]
+    removed = cache.keys() - stamps.keys()
+    if stale or removed:
+        for f in removed:
+            del cache[f]
+        for f, record in zip(stale, _load_parallel(load_scores, stale)):
+            cache[f] = {"stamp": stamps[f], "record": record}
+        write_json(cache, cache_file)
+    return [cache[f]["record"] for f in files]
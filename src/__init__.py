@@ -3,15 +3,10 @@ CDCT Framework - Source package initialization
 """
 
 # This file makes src/ a proper Python package
-# Import key modules for easier access
+# Key modules are imported lazily on first attribute access, so importing a
+# light module (e.g. compression_validator) does not pull in the model SDKs
 
-from . import agent
-from . import concept
-from . import evaluation
-from . import analysis
-from . import experiment
-from . import prompting
-from . import compression_validator
+import importlib
 
 __all__ = [
     'agent',
@@ -21,4 +16,10 @@ __all__ = [
     'experiment',
     'prompting',
     'compression_validator'
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    if name in __all__:
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -106,6 +106,28 @@ def get_azure_anthropic_client(api_key: str, base_url: str):
     return _azure_anthropic_clients[key]
 
 
+# Shared keep-alive HTTP session for the raw-HTTP agents (thread-safe)
+_http_session = None
+_http_session_lock = Lock()
+HTTP_POOL_SIZE = 16
+
+def get_http_session():
+    """Get or create the requests session shared by all raw-HTTP agents."""
+    global _http_session
+
+    if _http_session is None:
+        with _http_session_lock:
+            # Double-check pattern to avoid race conditions
+            if _http_session is None:
+                import requests
+                session = requests.Session()
+                # One pool per host, sized for concurrent jury/subject calls
+                session.mount("https://", requests.adapters.HTTPAdapter(pool_maxsize=HTTP_POOL_SIZE))
+                _http_session = session
+
+    return _http_session
+
+
 class AzureOpenAIAgent(Agent):
     """Agent for Azure OpenAI native models with retry support."""
     def __init__(self, model_name: str, deployment_name: str = None,
@@ -183,8 +205,6 @@ class AzureOpenAIInputAgent(Agent):
 
     def chat(self, messages: list) -> str:
         def _call():
-            import requests
-
             # Convert messages to input format
             input_text = self._format_messages_to_input(messages)
 
@@ -205,7 +225,7 @@ class AzureOpenAIInputAgent(Agent):
             }
 
             # Make the request
-            response = requests.post(url, headers=headers, json=body, timeout=120)
+            response = get_http_session().post(url, headers=headers, json=body, timeout=120)
             response.raise_for_status()
 
             result = response.json()
@@ -236,8 +256,6 @@ class AzureOpenAIBearerAgent(Agent):
 
     def chat(self, messages: list) -> str:
         def _call():
-            import requests
-
             # Construct the URL
             url = f"{self.azure_endpoint}/openai/deployments/{self.deployment_name}/chat/completions?api-version={self.api_version}"
 
@@ -255,7 +273,7 @@ class AzureOpenAIBearerAgent(Agent):
             }
 
             # Make the request
-            response = requests.post(url, headers=headers, json=body, timeout=120)
+            response = get_http_session().post(url, headers=headers, json=body, timeout=120)
             response.raise_for_status()
 
             result = response.json()
@@ -408,12 +426,11 @@ class BedrockAgent(Agent):
 
     def chat(self, messages: list) -> str:
         def _call():
-            import requests
             body = {
                 "messages": [{"role": m["role"], "content": [{"text": m["content"]}]} for m in messages],
                 "inferenceConfig": {"temperature": 0.0, "maxTokens": self.max_tokens},
             }
-            resp = requests.post(
+            resp = get_http_session().post(
                 self.url,
                 headers={"Content-Type": "application/json", "Authorization": f"Bearer {self.api_key}"},
                 json=body, timeout=300,
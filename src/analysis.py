@@ -30,7 +30,9 @@ def analyze_results(results: Dict[str, Any]) -> Dict[str, Any]:
             }
         }
     
-    scores = np.array([p["score"] for p in performance])
+    # fromiter with a known count writes straight into one preallocated buffer
+    n_levels = len(performance)
+    scores = np.fromiter((p["score"] for p in performance), dtype=np.float64, count=n_levels)
 
     # =========================================================================
     # Create a continuous compression scale `c` based on information content.
@@ -38,7 +40,7 @@ def analyze_results(results: Dict[str, Any]) -> Dict[str, Any]:
     # is the fraction of original information retained. We use word count as
     # a proxy for information content, creating a non-linear scale.
     # =========================================================================
-    context_lengths = np.array([p.get("context_length", 0) for p in performance])
+    context_lengths = np.fromiter((p.get("context_length", 0) for p in performance), dtype=np.float64, count=n_levels)
     max_context_length = np.max(context_lengths) if len(context_lengths) > 0 else 0
 
     if max_context_length > 0:
@@ -55,14 +57,12 @@ def analyze_results(results: Dict[str, Any]) -> Dict[str, Any]:
     # Definition: C_h = min{c : P(c) >= threshold}. A lower C_h is better.
     # =========================================================================
     threshold = 0.7
-    c_h = None
     
     # Find the minimum c_value where performance meets the threshold.
-    # This is the first point on the sorted c_values scale to pass.
-    for i, p in enumerate(performance):
-        if p["score"] >= threshold:
-            c_h = c_values[i]  # C_h is the continuous c-value
-            break
+    # This is the first point on the sorted c_values scale to pass,
+    # taken from the scores array already built above.
+    passing = np.flatnonzero(scores >= threshold)
+    c_h = c_values[passing[0]] if passing.size else None  # C_h is the continuous c-value
     # If no level passes, c_h remains None.
 
     # =========================================================================
@@ -151,6 +151,25 @@ def analyze_results(results: Dict[str, Any]) -> Dict[str, Any]:
     return results
 
 
+def _group_stats(keys: List[str], values: np.ndarray) -> Dict[str, Dict[str, float]]:
+    """
+    Per-group count, mean and population std of values, keyed by group name.
+    
+    Keys are mapped to integer codes once; counts, sums and squared
+    deviations from the group mean then come from one np.bincount pass each.
+    Groups are returned in first-seen order.
+    """
+    names, first, codes = np.unique(np.asarray(keys), return_index=True, return_inverse=True)
+    counts = np.bincount(codes, minlength=len(names))
+    means = np.bincount(codes, weights=values, minlength=len(names)) / counts
+    sq_devs = np.bincount(codes, weights=(values - means[codes]) ** 2, minlength=len(names))
+    stds = np.sqrt(sq_devs / counts)
+    return {
+        str(names[g]): {"n": int(counts[g]), "mean": float(means[g]), "std": float(stds[g])}
+        for g in np.argsort(first)
+    }
+
+
 def analyze_multi_concept(all_results: List[Dict[str, Any]]) -> Dict[str, Any]:
     """
     Aggregates results across multiple concepts for benchmarking.
@@ -162,39 +181,40 @@ def analyze_multi_concept(all_results: List[Dict[str, Any]]) -> Dict[str, Any]:
         Aggregate statistics (mean CSI, domain breakdown, etc.)
     """
     csi_values = []
+    csi_domains = []
     c_h_values = []
-    domains = {}
     
     for result in all_results:
-        analysis = result.get("analysis", {})
+        analysis = result.get("analysis")
+        if not analysis:
+            continue
         csi = analysis.get("CSI")
         c_h = analysis.get("C_h")
-        domain = result.get("domain", "unknown")
         
         if csi is not None:
             csi_values.append(csi)
-            
-            if domain not in domains:
-                domains[domain] = []
-            domains[domain].append(csi)
+            csi_domains.append(result.get("domain", "unknown"))
         
         if c_h is not None:
             c_h_values.append(c_h)
     
+    csi_values = np.asarray(csi_values, dtype=np.float64)
+    domain_stats = _group_stats(csi_domains, csi_values) if csi_domains else {}
+    
     aggregate = {
         "model": all_results[0]["model"] if all_results else None,
         "n_concepts": len(all_results),
-        "mean_CSI": float(np.mean(csi_values)) if csi_values else None,
+        "mean_CSI": float(np.mean(csi_values)) if len(csi_values) else None,
         "CSI_std": float(np.std(csi_values)) if len(csi_values) > 1 else None,
         "mean_C_h": float(np.mean(c_h_values)) if c_h_values else None,
         "domain_breakdown": {
             domain: {
-                "mean_CSI": float(np.mean(csi_list)),
-                "std_CSI": float(np.std(csi_list)) if len(csi_list) > 1 else 0,
-                "n_concepts": len(csi_list)
+                "mean_CSI": st["mean"],
+                "std_CSI": st["std"] if st["n"] > 1 else 0,
+                "n_concepts": st["n"]
             }
-            for domain, csi_list in domains.items()
+            for domain, st in domain_stats.items()
         }
     }
     
-    return aggregate
\ No newline at end of file
+    return aggregate
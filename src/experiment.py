@@ -1,7 +1,7 @@
 """
 Experiment runner - Orchestrates CDCT experiments
 """
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 import json
 import os
 from dotenv import load_dotenv
@@ -28,7 +28,8 @@ def run_experiment(
     agent: agent_loader.Agent,
     prompt_strategy: str = "compression_aware",
     evaluation_mode: str = "balanced",
-    verbose: bool = True
+    verbose: bool = True,
+    concept: Optional[concept_loader.Concept] = None
 ) -> Dict[str, Any]:
     """
     Runs complete CDCT experiment with integrated improvements.
@@ -39,12 +40,13 @@ def run_experiment(
         prompt_strategy: "compression_aware", "few_shot", or "simple"
         evaluation_mode: "strict", "balanced", or "lenient"
         verbose: Print progress
+        concept: Already-loaded concept for concept_path (skips re-reading the file)
     
     Returns:
         Complete results dictionary with analysis
     """
     # Load concept
-    loaded_concept = concept_loader.load_concept(concept_path)
+    loaded_concept = concept if concept is not None else concept_loader.load_concept(concept_path)
     
     results = {
         "concept": loaded_concept.concept,
@@ -195,6 +197,7 @@ def compare_strategies(concept_path: str, agent):
     """
     strategies = ["simple", "compression_aware", "few_shot"]
     results = {}
+    loaded_concept = concept_loader.load_concept(concept_path)
     
     for strategy in strategies:
         print(f"\n{'#'*70}")
@@ -204,7 +207,8 @@ def compare_strategies(concept_path: str, agent):
         result = run_experiment(
             concept_path, agent, 
             prompt_strategy=strategy,
-            verbose=True
+            verbose=True,
+            concept=loaded_concept
         )
         results[strategy] = result
     
@@ -5,6 +5,7 @@ Replaces mechanical evaluation with 3-judge consensus system
 from typing import Dict, Any, List, Optional
 import json
 import os
+import numpy as np
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
@@ -31,7 +32,8 @@ def run_experiment_with_jury(
     jury_agents: Dict[str, agent_loader.Agent],
     prompt_strategy: str = "compression_aware",
     ablation_type: Optional[str] = None,
-    verbose: bool = True
+    verbose: bool = True,
+    concept: Optional[concept_loader.Concept] = None
 ) -> Dict[str, Any]:
     """
     Runs CDCT experiment with jury-based evaluation.
@@ -43,12 +45,13 @@ def run_experiment_with_jury(
         prompt_strategy: "compression_aware", "few_shot", or "simple"
         ablation_type: "no_helpfulness" for RLHF ablation, None for baseline
         verbose: Print progress
+        concept: Already-loaded concept for concept_path (skips re-reading the file)
     
     Returns:
         Complete results dictionary with jury evaluations
     """
     # Load concept
-    loaded_concept = concept_loader.load_concept(concept_path)
+    loaded_concept = concept if concept is not None else concept_loader.load_concept(concept_path)
     
     # Initialize jury
     jury = LLMJury(judges=jury_agents)
@@ -206,46 +209,56 @@ def _analyze_jury_results(results: Dict[str, Any]) -> Dict[str, Any]:
             "mean_score": 0.0,
             "mean_agreement": 0.0,
             "decay_direction": "N/A",
+            "improves_with_compression": False,
             "error": "No valid performance data"
         }
         return results
     
-    scores = [p.get("score", 0.0) for p in performance]
-    compression_levels = [p["compression_level"] for p in performance]
-    
-    # Extract agreement scores
+    # Single pass over the performance entries; every statistic below is
+    # then an array reduction over these columns
+    scores = []
+    compression_levels = []
     agreements = []
     for p in performance:
-        jury_eval = p.get("jury_evaluation", {})
-        consensus = jury_eval.get("consensus", {})
-        agreement = consensus.get("agreement_score", 0.0)
-        if agreement > 0:
-            agreements.append(agreement)
+        scores.append(p.get("score", 0.0))
+        compression_levels.append(p["compression_level"])
+        # Chained .get(..., {}) would allocate two throwaway dicts per entry
+        jury_eval = p.get("jury_evaluation")
+        consensus = jury_eval.get("consensus") if jury_eval else None
+        agreements.append(consensus.get("agreement_score", 0.0) if consensus else 0.0)
+    
+    score_arr = np.asarray(scores, dtype=np.float64)
+    level_arr = np.asarray(compression_levels, dtype=np.float64)
+    agreement_arr = np.asarray(agreements, dtype=np.float64)
+    agreement_arr = agreement_arr[agreement_arr > 0]
+    agreements = agreement_arr.tolist()
     
-    mean_score = sum(scores) / len(scores) if scores else 0.0
-    mean_agreement = sum(agreements) / len(agreements) if agreements else 0.0
+    mean_score = float(score_arr.mean())
+    mean_agreement = float(agreement_arr.mean()) if agreement_arr.size else 0.0
     
     # Compute CSI (Compression Stability Index)
     # Lower compression (higher compression_level) should have higher scores
-    high_compression_scores = [s for s, c in zip(scores, compression_levels) if c >= max(compression_levels) * 0.5]
-    low_compression_scores = [s for s, c in zip(scores, compression_levels) if c < min(compression_levels) * 0.75]
+    high_compression_scores = score_arr[level_arr >= level_arr.max() * 0.5]
+    low_compression_scores = score_arr[level_arr < level_arr.min() * 0.75]
     
     csi = 0.0
-    if high_compression_scores and low_compression_scores:
+    if high_compression_scores.size and low_compression_scores.size:
         # CSI measures how well model maintains performance across compression levels
-        avg_high = sum(high_compression_scores) / len(high_compression_scores)
-        avg_low = sum(low_compression_scores) / len(low_compression_scores)
-        csi = avg_high - avg_low  # Positive = good (maintains performance even with less context)
+        csi = float(high_compression_scores.mean() - low_compression_scores.mean())  # Positive = good (maintains performance even with less context)
     
-    # Determine decay direction
+    # Determine decay direction; the improvement flag is recorded alongside so
+    # consumers need not substring-match the display label
+    improves_with_compression = False
     if len(scores) >= 2:
-        early_avg = sum(scores[:len(scores)//2]) / (len(scores)//2) if len(scores) >= 2 else scores[0]
-        late_avg = sum(scores[len(scores)//2:]) / (len(scores) - len(scores)//2) if len(scores) >= 2 else scores[-1]
+        half = len(scores) // 2
+        early_avg = score_arr[:half].mean()
+        late_avg = score_arr[half:].mean()
         
         if early_avg > late_avg + 0.05:
             decay_direction = "↓ Graceful (expected)"
         elif early_avg < late_avg - 0.05:
             decay_direction = "↑ Improvement with compression"
+            improves_with_compression = True
         else:
             decay_direction = "→ Stable"
     else:
@@ -256,6 +269,7 @@ def _analyze_jury_results(results: Dict[str, Any]) -> Dict[str, Any]:
         "mean_score": mean_score,
         "mean_agreement": mean_agreement,
         "decay_direction": decay_direction,
+        "improves_with_compression": improves_with_compression,
         "compression_levels": compression_levels,
         "scores": scores,
         "agreement_scores": agreements
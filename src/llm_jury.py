@@ -12,7 +12,9 @@ Jury members (zero family overlap with contestants):
 - NVIDIA Nemotron Super 3 120B: Functional completeness (FC primary)
 """
 
+import hashlib
 import json
+import re
 import numpy as np
 import sys
 import os
@@ -22,6 +24,22 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 sys.path.insert(0, os.path.dirname(__file__))
 
 from agent import Agent
+from utils.response_cache import ResponseCache
+
+# Verdict wrapped in a markdown code block, compiled once at import
+_CODE_BLOCK_JSON_RE = re.compile(r'```(?:json)?\s*(\{.*?\})\s*```', re.DOTALL)
+
+# Persistent judge-response cache keyed by (judge, model, prompt); CDCT_NO_JURY_CACHE=1 disables it.
+# Raw responses are stored rather than parsed verdicts, so parser fixes apply on replay.
+JURY_CACHE_FILE = os.getenv("CDCT_JURY_CACHE_FILE", ".jury_cache.sqlite")
+USE_JURY_CACHE = os.getenv("CDCT_NO_JURY_CACHE") != "1"
+
+# Failures disable the cache for the run rather than dropping jury scores
+_jury_cache = ResponseCache(JURY_CACHE_FILE)
+
+
+def _jury_cache_key(judge_name: str, model_name: str, prompt: str) -> str:
+    return hashlib.sha256("\x1f".join((judge_name, model_name, prompt)).encode()).hexdigest()
 
 
 class LLMJury:
@@ -239,14 +257,21 @@ class LLMJury:
                     metric_to_evaluate=metric
                 )
 
-                # 2. Call agent
-                response_text = agent.query(eval_prompt)
+                # 2. Call agent (or replay a cached response to the same prompt)
+                cache_key = _jury_cache_key(judge_name, agent.model_name, eval_prompt) if USE_JURY_CACHE else None
+                response_text = _jury_cache.get(cache_key) if cache_key else None
+                cached = response_text is not None
+                if not cached:
+                    response_text = agent.query(eval_prompt)
 
                 # 3. Parse response
                 verdict = self._parse_verdict(response_text)
 
                 if verdict.get("score") is not None:
                     scores[metric] = verdict["score"]
+                    # Only scoreable responses are cached, so malformed ones are retried on rerun
+                    if cache_key and not cached:
+                        _jury_cache.put(cache_key, response_text)
                 else:
                     scores[metric] = None
                     errors.append(verdict.get("error", f"Unknown parse error for {metric}"))
@@ -460,11 +485,8 @@ Respond with ONLY valid JSON containing a single "score" key (no markdown, no ex
     def _parse_verdict(self, response_text: str) -> Dict:
         """Parse JSON response into a verdict dict with a single 'score' key."""
         try:
-            import json
-            import re
-
             # Try to extract JSON from markdown code blocks if present
-            json_match = re.search(r'```(?:json)?\s*(\{.*?\})\s*```', response_text, re.DOTALL)
+            json_match = _CODE_BLOCK_JSON_RE.search(response_text)
             if json_match:
                 response_text = json_match.group(1)
 
@@ -2,6 +2,53 @@
 Prompting module - Creates compression-aware prompts
 """
 
+# Constant prompt fragments, built once at import and joined per call
+_HIGH_COMPRESSION_CONSTRAINT = """
+CRITICAL: You have minimal information (2-5 words). Answer using ONLY these words.
+Do NOT elaborate beyond what's given. Keep response under 20 words."""
+
+_MEDIUM_COMPRESSION_CONSTRAINT = """
+IMPORTANT: Answer using ONLY the information provided above.
+Keep your response brief (2-3 sentences max). Do not add details
+not present in the context."""
+
+_LOW_COMPRESSION_CONSTRAINT = """
+Using the context above, provide a clear explanation.
+You may elaborate on the concepts mentioned."""
+
+_COMPRESSION_AWARE_PREFIX = """You are being tested on comprehension with limited information.
+
+AVAILABLE INFORMATION:
+"""
+
+_MINIMAL_PREFIX = "AVAILABLE INFORMATION:\n"
+
+_QUESTION_PREFIX = "\n\nQUESTION: "
+_ANSWER_SUFFIX = "\n\nANSWER:"
+
+_FEW_SHOT_EXAMPLES = {
+    0: """Examples of good answers with minimal context:
+
+Context: "acceleration"
+Q: What is force?
+A: "mass times acceleration"
+
+Context: "base times height"  
+Q: Area of triangle?
+A: "half of base times height"
+
+Your turn:
+""",
+    1: """Example:
+Context: "slope of the curve"
+Q: What is a derivative?
+A: "The derivative represents the slope of a curve at a point"
+
+Your turn:
+""",
+}
+
+
 def create_compression_aware_prompt(
     context: str,
     question: str,
@@ -26,33 +73,14 @@ def create_compression_aware_prompt(
     compression_ratio = 1 - (compression_level / max_compression)
     
     if compression_ratio > 0.8:  # Very high compression (level 0-1)
-        constraint = """
-CRITICAL: You have minimal information (2-5 words). Answer using ONLY these words.
-Do NOT elaborate beyond what's given. Keep response under 20 words."""
-    
+        constraint = _HIGH_COMPRESSION_CONSTRAINT
     elif compression_ratio > 0.5:  # Medium compression (level 2-3)
-        constraint = """
-IMPORTANT: Answer using ONLY the information provided above.
-Keep your response brief (2-3 sentences max). Do not add details
-not present in the context."""
-    
+        constraint = _MEDIUM_COMPRESSION_CONSTRAINT
     else:  # Low compression (level 4+)
-        constraint = """
-Using the context above, provide a clear explanation.
-You may elaborate on the concepts mentioned."""
-    
-    prompt = f"""You are being tested on comprehension with limited information.
-
-AVAILABLE INFORMATION:
-{context}
-
-{constraint}
-
-QUESTION: {question}
-
-ANSWER:"""
+        constraint = _LOW_COMPRESSION_CONSTRAINT
     
-    return prompt
+    return "".join((_COMPRESSION_AWARE_PREFIX, context, "\n\n", constraint,
+                    _QUESTION_PREFIX, question, _ANSWER_SUFFIX))
 
 
 def create_few_shot_prompt(
@@ -71,29 +99,7 @@ def create_few_shot_prompt(
     Returns:
         Prompt with examples
     """
-    if compression_level == 0:
-        examples = """Examples of good answers with minimal context:
-
-Context: "acceleration"
-Q: What is force?
-A: "mass times acceleration"
-
-Context: "base times height"  
-Q: Area of triangle?
-A: "half of base times height"
-
-Your turn:
-"""
-    elif compression_level == 1:
-        examples = """Example:
-Context: "slope of the curve"
-Q: What is a derivative?
-A: "The derivative represents the slope of a curve at a point"
-
-Your turn:
-"""
-    else:
-        examples = ""
+    examples = _FEW_SHOT_EXAMPLES.get(compression_level, "")
     
     return f"""{examples}
 Context: {context}
@@ -131,15 +137,6 @@ def create_minimal_prompt(context: str, question: str) -> str:
     Returns:
         Minimal prompt without helpfulness cues
     """
-    prompt = f"""AVAILABLE INFORMATION:
-{context}
-
-IMPORTANT: Answer using ONLY the information provided above.
-Keep your response brief (2-3 sentences max). Do not add details
-not present in the context.
-
-QUESTION: {question}
-
-ANSWER:"""
-    
-    return prompt
\ No newline at end of file
+    # The medium constraint carries a leading newline, which doubles as the separator after context
+    return "".join((_MINIMAL_PREFIX, context, "\n", _MEDIUM_COMPRESSION_CONSTRAINT,
+                    _QUESTION_PREFIX, question, _ANSWER_SUFFIX))
@@ -0,0 +1,62 @@
+"""
+Persistent SQLite cache of LLM responses, keyed by a caller-computed hash.
+
+Shared by the IFEval runner and the LLM jury. The cache is an optimization
+only: any SQLite or filesystem error disables it for the rest of the process
+and callers fall through to a live model call.
+"""
+import os
+import sqlite3
+import zlib
+from threading import Lock
+
+
+class ResponseCache:
+    """Thread-safe key -> response store, opened lazily on first use."""
+
+    def __init__(self, path):
+        self.path = path
+        self.enabled = True
+        self._conn = None
+        self._lock = Lock()
+
+    def _connect(self):
+        """Open the database on first use (caller holds _lock)."""
+        if self._conn is None:
+            parent = os.path.dirname(os.fspath(self.path))
+            if parent:
+                os.makedirs(parent, exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute("CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, response BLOB)")
+        return self._conn
+
+    def _disable(self, exc):
+        self.enabled = False
+        print(f"⚠ Response cache {self.path} disabled: {exc}")
+
+    def get(self, key):
+        """Stored response for key, or None on a miss or cache failure."""
+        if not self.enabled:
+            return None
+        try:
+            with self._lock:
+                row = self._connect().execute("SELECT response FROM responses WHERE key = ?", (key,)).fetchone()
+        except (sqlite3.Error, OSError) as e:
+            self._disable(e)
+            return None
+        return zlib.decompress(row[0]).decode() if row else None
+
+    def put(self, key, response):
+        """Store response under key; a cache failure is reported, never raised."""
+        if not self.enabled:
+            return
+        try:
+            with self._lock:
+                conn = self._connect()
+                conn.execute(
+                    "INSERT OR REPLACE INTO responses (key, response) VALUES (?, ?)",
+                    (key, zlib.compress(response.encode())),
+                )
+                conn.commit()
+        except (sqlite3.Error, OSError) as e:
+            self._disable(e)
@@ -16,14 +16,20 @@ Expected outcomes:
 import sys
 import os
 import json
+from collections import Counter
 from datetime import datetime
 
 # Assuming these imports work from your existing setup
 from agent import create_agent
+from concept import load_concept
 from experiment_jury import run_experiment_with_jury
 from llm_jury import LLMJury as OriginalJury
 from llm_jury_fixed import LLMJury as FixedJury
 
+# Verdict category labels, counted in the final analysis
+ARTIFACT_VERDICT = "ARTIFACT CONFIRMED"
+REAL_VERDICT = "REAL PHENOMENON"
+
 
 def run_verification_experiment(
     concepts: list,  # List of concept file paths
@@ -72,6 +78,8 @@ def run_verification_experiment(
         
         for concept_path in concepts:
             concept_name = os.path.basename(concept_path).replace('.json', '')
+            # Both jury runs below use the same concept; parse it once
+            loaded_concept = load_concept(concept_path)
             
             print(f"\n{'─'*80}")
             print(f"CONCEPT: {concept_name}")
@@ -90,7 +98,8 @@ def run_verification_experiment(
                 subject_agent=subject_agent,
                 jury=original_jury,
                 jury_agents=jury_agents,
-                verbose=False
+                verbose=False,
+                concept=loaded_concept
             )
             
             print(f"  Original Mean Score: {original_result['analysis']['mean_score']:.4f}")
@@ -109,7 +118,8 @@ def run_verification_experiment(
                 subject_agent=subject_agent,
                 jury=fixed_jury,
                 jury_agents=jury_agents,
-                verbose=False
+                verbose=False,
+                concept=loaded_concept
             )
             
             print(f"  Fixed Mean Score: {fixed_result['analysis']['mean_score']:.4f}")
@@ -144,13 +154,13 @@ def run_verification_experiment(
             comparison["delta_csi"] = delta_csi
             
             # Determine verdict
-            original_improves = "↑" in original_result['analysis']['decay_direction']
-            fixed_improves = "↑" in fixed_result['analysis']['decay_direction']
+            original_improves = original_result['analysis']['improves_with_compression']
+            fixed_improves = fixed_result['analysis']['improves_with_compression']
             
             if original_improves and not fixed_improves:
-                verdict = "ARTIFACT CONFIRMED - Fix resolved compression benefit"
+                verdict = f"{ARTIFACT_VERDICT} - Fix resolved compression benefit"
             elif original_improves and fixed_improves:
-                verdict = "REAL PHENOMENON - Compression benefit persists with fix"
+                verdict = f"{REAL_VERDICT} - Compression benefit persists with fix"
             elif not original_improves and not fixed_improves:
                 verdict = "CONSISTENT DECAY - Both show expected behavior"
             else:
@@ -164,9 +174,10 @@ def run_verification_experiment(
             
             results["comparisons"].append(comparison)
             
-            # Save intermediate results
+            # Save intermediate results (compact: rewritten after every comparison;
+            # the final results file below keeps indentation for reading)
             with open(f"{output_dir}/verification_partial.json", 'w') as f:
-                json.dump(results, f, indent=2)
+                json.dump(results, f, separators=(",", ":"))
     
     # ============================================================
     # Final Analysis
@@ -175,8 +186,10 @@ def run_verification_experiment(
     print("VERIFICATION EXPERIMENT RESULTS")
     print("="*80 + "\n")
     
-    artifact_count = sum(1 for c in results["comparisons"] if "ARTIFACT" in c["verdict"])
-    real_count = sum(1 for c in results["comparisons"] if "REAL" in c["verdict"])
+    # Tally verdict categories (the label before " - ") in one pass
+    verdict_counts = Counter(c["verdict"].split(" - ", 1)[0] for c in results["comparisons"])
+    artifact_count = verdict_counts[ARTIFACT_VERDICT]
+    real_count = verdict_counts[REAL_VERDICT]
     total = len(results["comparisons"])
     
     print(f"Total comparisons: {total}")
@@ -211,16 +224,15 @@ def run_verification_experiment(
     return results
 
 
-def _run_with_specific_jury(concept_path, subject_agent, jury, jury_agents, verbose=False):
+def _run_with_specific_jury(concept_path, subject_agent, jury, jury_agents, verbose=False, concept=None):
     """Helper to run experiment with a specific jury instance."""
     # This is a bit hacky - we need to modify experiment_jury.py to accept
     # a jury instance rather than creating its own
     # For now, we'll inline the logic
     
-    from concept import load_concept
     from prompting import create_compression_aware_prompt
     
-    loaded_concept = load_concept(concept_path)
+    loaded_concept = concept if concept is not None else load_concept(concept_path)
     
     results = {
         "concept": loaded_concept.concept,